@@ -0,0 +1,13 @@
+"""MTConnect adapter core shared by the MQTT and OPC UA front-ends.
+
+Sources (mtconnect_adapter.sources.mqtt / .opcua) write into one
+ObservationStore; the Flask app renders the DeviceModel and the stored
+observations as MTConnect documents.
+"""
+
+from .metrics import PerformanceMonitor
+from .path_filter import PathFilter
+from .registry import DeviceModel
+from .runner import run
+from .server import create_app
+from .store import ObservationStore
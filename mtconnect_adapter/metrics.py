@@ -0,0 +1,99 @@
+import datetime
+import os
+import threading
+import time
+
+import psutil
+
+# Performance metrics: (DataItem id, key in metrics, type, units)
+# VALUE_RATE (received variable values per second over all sources) is an
+# addition of the shared adapter core; the original adapters only had UPDATE_RATE
+METRIC_ITEMS = [
+    ("DELAY_MS", "delay_ms", "PROCESS_TIME", "MILLISECOND"),
+    ("VALUE_RATE", "value_rate", "PROCESS_TIMER", "COUNT/SECOND"),
+    ("MEMORY_MB", "memory_mb", "PROCESS_METRIC", "MEGABYTE"),
+    ("CPU_PERCENT", "cpu_percent", "PROCESS_METRIC", "PERCENT"),
+]
+
+class PerformanceMonitor:
+    """Collects adapter performance metrics and publishes them as device data items.
+
+    Update cycles (OPC UA polls, MQTT messages) are counted per source, so
+    every source gets its own <prefix>UPDATE_RATE data item; a single source
+    without prefix keeps the plain UPDATE_RATE.
+    """
+
+    def __init__(self, model, store, title="MTConnect", sources=(), console=True, interval=3):
+        self.model = model
+        self.store = store
+        self.title = title
+        self.sources = list(sources)
+        self.console = console
+        self.interval = interval
+        self.process = psutil.Process(os.getpid())
+        self.metrics = {
+            "delay_ms": 0,
+            "update_rates": {source.name: 0 for source in self.sources},
+            "value_rate": 0,
+            "memory_mb": 0,
+            "cpu_percent": 0,
+            "last_updated": time.time()
+        }
+        for item_id, key, dtype, units in METRIC_ITEMS:
+            model.add_data_item(model.device, item_id, item_id, "SAMPLE", dtype, units)
+        for source in self.sources:
+            item_id = f"{source.prefix}UPDATE_RATE"
+            model.add_data_item(model.device, item_id, item_id, "SAMPLE", "PROCESS_TIMER", "COUNT/SECOND")
+
+    def update(self):
+        self.metrics["cpu_percent"] = self.process.cpu_percent(interval=1.0)
+        self.metrics["memory_mb"] = self.process.memory_info().rss / (1024 * 1024)
+        for source in self.sources:
+            self.metrics["update_rates"][source.name] = self.store.update_rate(source.prefix)
+        self.metrics["value_rate"] = self.store.value_rate()
+        self.metrics["delay_ms"] = self.store.average_delay_ms()
+        self.metrics["last_updated"] = time.time()
+
+        for item_id, key, dtype, units in METRIC_ITEMS:
+            self.store.update(item_id, f"{self.metrics[key]:.2f}", internal=True)
+        for source in self.sources:
+            self.store.update(f"{source.prefix}UPDATE_RATE", f"{self.metrics['update_rates'][source.name]:.2f}", internal=True)
+
+    def print_console(self):
+        # Clear console on Windows
+        if os.name == 'nt':
+            os.system('cls')
+        else:
+            os.system('clear')  # For Linux/Mac
+
+        current_time = datetime.datetime.now().strftime("%H:%M:%S")
+        print("\n" + "="*50)
+        print(f"  {self.title}-MTConnect ADAPTER PERFORMANCE ({current_time})")
+        print("="*50)
+        print(f"Verzögerung:         {self.metrics['delay_ms']:.2f} ms")
+        for name, update_rate in self.metrics["update_rates"].items():
+            label = f"Abfragerate ({name}):" if len(self.sources) > 1 else "Abfragerate:"
+            print(f"{label:<20} {update_rate:.2f} Updates/Sek")
+        print(f"Empfangene Werte:    {self.metrics['value_rate']:.2f} Werte/Sek")
+        print(f"Speicherverbrauch:   {self.metrics['memory_mb']:.2f} MB")
+        print(f"CPU-Auslastung:      {self.metrics['cpu_percent']:.2f}%")
+        print("-"*50)
+        print(f"Empfangene Updates:    {self.store.update_count}")
+        print(f"Überwachte Variablen:  {len(self.store.received)}")
+        print("="*50)
+        print("\nDrücke CTRL+C zum Beenden...")
+
+    def run(self):
+        """Update performance metrics periodically"""
+        while True:
+            try:
+                self.update()
+                if self.console:
+                    self.print_console()
+                time.sleep(self.interval)
+            except Exception as e:
+                print(f"Error updating performance metrics: {e}")
+                time.sleep(1)
+
+    def start(self):
+        threading.Thread(target=self.run, daemon=True).start()
@@ -0,0 +1,132 @@
+import html
+import re
+import threading
+import time
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
+
+# Trennzeichen für "|" Pfade und "or" Bedingungen, z.B. [@type="AMPERAGE" or @type="VOLTAGE"]
+UNION_SEPARATOR = re.compile(r"\|")
+OR_SEPARATOR = re.compile(r"\s+or\s+")
+
+def split_unquoted(text, separator):
+    """Split text at separator, ignoring separators inside quoted literals"""
+    parts = []
+    start = 0
+    quote = None
+    i = 0
+    while i < len(text):
+        char = text[i]
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        else:
+            match = separator.match(text, i)
+            if match and match.end() > i:
+                parts.append(text[start:i])
+                start = i = match.end()
+                continue
+        i += 1
+    parts.append(text[start:])
+    return parts
+
+def expand_or(expression):
+    """Split "or" predicates into separate paths, ElementTree only supports one condition"""
+    quote = None
+    predicate_start = None
+    for i, char in enumerate(expression):
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char == "[":
+            predicate_start = i
+        elif char == "]" and predicate_start is not None:
+            conditions = split_unquoted(expression[predicate_start + 1:i], OR_SEPARATOR)
+            if len(conditions) > 1:
+                expressions = []
+                for condition in conditions:
+                    expressions += expand_or(expression[:predicate_start] + f"[{condition.strip()}]" + expression[i + 1:])
+                return expressions
+            predicate_start = None
+    return [expression]
+
+class PathFilter:
+    """Compiles MTConnect path= expressions into data item indices.
+
+    Paths are evaluated once against the probe document (ElementTree XPath
+    subset plus "or" predicates, e.g. //DataItem[@type="AMPERAGE"] or
+    //Welding, multiple paths separated by "|"). The resulting indices are
+    kept in an LRU cache so repeated polls with the same path skip the
+    evaluation entirely.
+    """
+
+    def __init__(self, data_item_ids, probe_xml, max_size=128):
+        self.data_item_ids = list(data_item_ids)
+        self.index_by_id = {item_id: index for index, item_id in enumerate(self.data_item_ids)}
+        self.max_size = max_size
+        self.cache = OrderedDict()
+        self.lock = threading.Lock()
+
+        root = ET.fromstring(probe_xml)
+        # Namespaces entfernen, damit Pfade ohne Präfix funktionieren
+        for element in root.iter():
+            if "}" in element.tag:
+                element.tag = element.tag.split("}", 1)[1]
+        # Wrapper, damit absolute Pfade (/MTConnectDevices/...) auflösbar sind
+        self.document = ET.Element("document")
+        self.document.append(root)
+
+    def compile(self, path):
+        """Return the sorted data item indices selected by path"""
+        with self.lock:
+            if path in self.cache:
+                self.cache.move_to_end(path)
+                return self.cache[path]
+
+        indices = self.evaluate(path)
+
+        with self.lock:
+            self.cache[path] = indices
+            if len(self.cache) > self.max_size:
+                self.cache.popitem(last=False)
+        return indices
+
+    def evaluate(self, path):
+        selected = set()
+        for expression in split_unquoted(path, UNION_SEPARATOR):
+            expression = expression.strip()
+            if not expression:
+                raise ValueError(f"Invalid path: {path}")
+            if expression.startswith("/"):
+                expression = "." + expression
+            try:
+                elements = []
+                for alternative in expand_or(expression):
+                    elements += self.document.findall(alternative)
+            except (SyntaxError, KeyError, TypeError) as e:
+                raise ValueError(f"Invalid path: {path}") from e
+            # Ausgewählte Components liefern alle DataItems darunter
+            for element in elements:
+                for data_item in element.iter("DataItem"):
+                    index = self.index_by_id.get(data_item.get("id"))
+                    if index is not None:
+                        selected.add(index)
+        return tuple(sorted(selected))
+
+    def select(self, path):
+        """Return the data item ids selected by path, in device model order"""
+        return [self.data_item_ids[index] for index in self.compile(path)]
+
+def error_xml(error_code, message):
+    """MTConnectError document for invalid requests"""
+    return f'''<?xml version="1.0" encoding="UTF-8"?>
+<MTConnectError xmlns="urn:mtconnect.org:MTConnectError:1.3" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">
+  <Header creationTime="{time.strftime('%Y-%m-%dT%H:%M:%SZ')}" sender="WeldingAdapter" instanceId="1" bufferSize="130000" version="1.3" />
+  <Errors>
+    <Error errorCode="{error_code}">{html.escape(message)}</Error>
+  </Errors>
+</MTConnectError>'''
@@ -0,0 +1,149 @@
+import re
+import threading
+
+# Variablen der Fronius Schweißstromquelle (MQTT Topics bzw. OPC UA BrowseNames)
+MONITORED_VARIABLES = [
+    "ACTUAL_CURRENT", "ACTUAL_VOLTAGE", "ACTUAL_POWER", "ACTUAL_WELDINGTIME", "ACTUAL_GASFLOW",
+    "ACTUAL_WFS", "DISPLAY_CURRENT", "DISPLAY_ENERGY", "DISPLAY_POWER",
+    "DISPLAY_STATUS", "DISPLAY_VOLTAGE", "DISPLAY_WFS", "WIREBUFFER_VALUE",
+    "ARCSTABLE", "ARC_LENGTH_STABILIZER_STATUS", "CURRENTFLOW", "ERROR",
+    "PENETRATION_STABILIZER_STATUS", "PROCESS_ACTIVE", "PROCESS_MAINPHASE",
+    "SAFETY_STATUS", "WIREEND_VALUE", "WIREEND_VALUE_DRUM", "WIREEND_VALUE_RINGSENSOR",
+    "ARCLENGTH_CORRECTION", "ARC_LENGTH_STABILIZER", "CURRENT_RECOMMVALUE",
+    "END_ARCLENGTH_CORRECTION", "END_CURRENT", "END_CURRENT_TIME", "GASFACTOR",
+    "GASPOSTFLOW", "GASPREFLOW", "GASVALUE", "PENETRATION_STABILIZER",
+    "PULSDYNAMIC_CORRECTION", "SFI", "SFI_HOTSTART", "SLOPE_1", "SLOPE_2",
+    "START_ARCLENGTH_CORRECTION", "START_CURRENT", "START_CURRENT_TIME",
+    "SYNCHROPULSE_ARCLENGTH_CORR_HIGH", "SYNCHROPULSE_ARCLENGTH_CORR_LOW",
+    "SYNCHROPULSE_DELTA_FEEDER", "SYNCHROPULSE_DUTYCYCLE", "SYNCHROPULSE_ENABLE",
+    "SYNCHROPULSE_FREQUENCY", "TRIGGER_MODE", "VOLTAGE_RECOMMVALUE",
+    "WELDING_MODE", "WFS_COMMANDVALUE",
+    "JOBMODE", "JOBNAME", "JOBNUMBER", "JOBREVISION", "JOBSLOPE"
+]
+
+def classify_variable(key):
+    """Guess MTConnect category, type and units from a variable name"""
+    category = "SAMPLE" if "STATUS" not in key else "EVENT"
+    # Generischer SAMPLE Typ wie im bisherigen /current (STRING ist kein gültiger Sample-Typ)
+    dtype = "VALUE"
+    units = None
+
+    if "CURRENT" in key:
+        dtype, units = "AMPERAGE", "AMPERE"
+    elif "VOLTAGE" in key:
+        dtype, units = "VOLTAGE", "VOLT"
+    elif "TEMP" in key or "TEMPERATURE" in key:
+        dtype, units = "TEMPERATURE", "CELSIUS"
+    elif "POWER" in key:
+        dtype, units = "POWER", "WATT"
+    elif "TIME" in key:
+        dtype, units = "ACCUMULATED_TIME", "SECOND"
+    elif "STATUS" in key:
+        dtype = "AVAILABILITY"
+    elif "GAS" in key:
+        dtype, units = "FLOW", "LITER/MINUTE"
+    elif "WFS" in key:
+        dtype, units = "VELOCITY", "MILLIMETER/SECOND"
+
+    return category, dtype, units
+
+class DeviceModel:
+    """Registry of the components and data items the adapter publishes.
+
+    Components and data items are plain dicts so the serializer can render
+    them directly. Sources register their data items here; every change
+    bumps version so cached probe documents and path filters get rebuilt.
+    """
+
+    def __init__(self, uuid="WELDING.001", name="WELDING"):
+        self.uuid = uuid
+        self.name = name
+        self.device = {"tag": "Device", "id": uuid, "name": name, "data_items": [], "components": []}
+        self.components = {uuid: self.device}
+        self.data_items = {}
+        self.item_components = {}
+        self.used_ids = {uuid}
+        self.version = 0
+        self.lock = threading.RLock()
+
+        self.add_data_item(self.device, "Wavail", "avail", "EVENT", "AVAILABILITY")
+        self.add_data_item(self.device, "Wfmode", "fmode", "EVENT", "FUNCTIONAL_MODE")
+
+    def add_component(self, component_id, name, parent=None, tag="Systems"):
+        """Add a component below parent (default: the device), existing ids are reused"""
+        with self.lock:
+            if component_id in self.components:
+                return self.components[component_id]
+            component = {"tag": tag, "id": component_id, "name": name, "data_items": [], "components": []}
+            (parent or self.device)["components"].append(component)
+            self.components[component_id] = component
+            self.used_ids.add(component_id)
+            self.version += 1
+            return component
+
+    def add_data_item(self, component, item_id, name, category, dtype, units=None, sub_type=None):
+        """Add a data item to component, existing ids are reused"""
+        with self.lock:
+            if item_id in self.data_items:
+                return self.data_items[item_id]
+            item = {"id": item_id, "name": name, "category": category, "type": dtype,
+                    "units": units, "sub_type": sub_type}
+            component["data_items"].append(item)
+            self.data_items[item_id] = item
+            self.item_components[item_id] = component
+            self.used_ids.add(item_id)
+            self.version += 1
+            return item
+
+    def add_variable(self, component, key):
+        """Add a data item whose type is guessed from its name"""
+        category, dtype, units = classify_variable(key)
+        return self.add_data_item(component, key, key, category, dtype, units)
+
+    def unique_id(self, path):
+        """Derive a unique MTConnect id from a browse path"""
+        with self.lock:
+            base = "W" + re.sub(r"[^A-Za-z0-9_.-]", "_", "_".join(path))
+            item_id = base
+            suffix = 2
+            while item_id in self.used_ids:
+                item_id = f"{base}_{suffix}"
+                suffix += 1
+            self.used_ids.add(item_id)
+            return item_id
+
+    def iter_components(self, components=None):
+        """Yield the device and all components depth-first"""
+        if components is None:
+            yield self.device
+            components = self.device["components"]
+        for component in components:
+            yield component
+            yield from self.iter_components(component["components"])
+
+    def ordered_ids(self):
+        """All data item ids in device model order"""
+        with self.lock:
+            return [item["id"] for component in self.iter_components() for item in component["data_items"]]
+
+def welding_component(model):
+    """The flat Welding component plus the Controller/Systems placeholders"""
+    with model.lock:
+        if "WeldingSystem" in model.components:
+            return model.components["WeldingSystem"]
+        welding = model.add_component("WeldingSystem", "WeldingSystem", tag="Welding")
+
+        controller = model.add_component("Wct1", "Controller", tag="Controller")
+        model.add_data_item(controller, "Westop", "estop", "EVENT", "EMERGENCY_STOP")
+        model.add_data_item(controller, "Wsystem", "system", "CONDITION", "SYSTEM")
+        model.add_data_item(controller, "Wpmode", "pmode", "EVENT", "CONTROLLER_MODE")
+        model.add_data_item(controller, "Wpprogram", "pprogram", "EVENT", "PROGRAM")
+        model.add_data_item(controller, "Wpexecution", "pexecution", "EVENT", "EXECUTION")
+        model.add_data_item(controller, "WpFovr", "pFovr", "EVENT", "PATH_FEEDRATE_OVERRIDE", "PERCENT", "PROGRAMMED")
+
+        systems = model.add_component("WSystems1", "Systems1", tag="Systems")
+        electric = model.add_component("WElectricSystem1", "ElectricSystem1", systems, tag="Electric")
+        model.add_data_item(electric, "WElectricSystem1_cond", "ElectricSystem1_cond", "CONDITION", "SYSTEM")
+        pneumatic = model.add_component("WPneumaticSystem1", "PneumaticSystem1", systems, tag="Pneumatic")
+        model.add_data_item(pneumatic, "WPneumaticSystem1_cond", "PneumaticSystem1_cond", "CONDITION", "SYSTEM")
+        return welding
@@ -0,0 +1,114 @@
+import socket
+
+from .metrics import PerformanceMonitor
+from .registry import DeviceModel
+from .server import create_app
+from .store import ObservationStore
+
+# Lokale IP-Adresse automatisch erkennen
+def get_local_ip():
+    try:
+        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        s.connect(("8.8.8.8", 80))
+        ip = s.getsockname()[0]
+        s.close()
+        return ip
+    except:
+        return "localhost"
+
+def configure_mqtt(model, store, prefix=""):
+    from .sources.mqtt import MqttSource, start_mosquitto
+
+    broker_process = start_mosquitto()
+    try:
+        default_ip = get_local_ip()
+        welding_ip = input(f"Enter welding machine IP (default={default_ip}): ") or default_ip
+        mqtt_port = input("MQTT Port (default=1883): ") or "1883"
+        return MqttSource(model, store, welding_ip, mqtt_port, prefix=prefix), broker_process
+    except BaseException:
+        # Broker nicht weiterlaufen lassen, wenn die Eingabe abgebrochen wird (CTRL+C)
+        broker_process.terminate()
+        raise
+
+def configure_opcua(model, store, prefix=""):
+    from .sources.opcua import OpcUaSource
+
+    default_ip = get_local_ip()
+    opcua_ip = input(f"OPC UA Server IP (default={default_ip}): ") or default_ip
+    opcua_port = input("OPC UA Server Port (default=4840): ") or "4840"
+    map_address_space = (input("Map OPC UA address space to MTConnect components? (y/N): ") or "n").lower().startswith("y")
+    return OpcUaSource(model, store, f"opc.tcp://{opcua_ip}:{opcua_port}", map_address_space, prefix=prefix), None
+
+SOURCES = {
+    "mqtt": configure_mqtt,
+    "opcua": configure_opcua,
+}
+
+def run(source_names, port=5050):
+    """Start the given sources and serve them from one MTConnect adapter"""
+    model = DeviceModel()
+    store = ObservationStore()
+    sources = []
+    processes = []
+
+    try:
+        for source_name in source_names:
+            # Mehrere Quellen bekommen eigene DataItem-IDs (z.B. MQTT_ACTUAL_CURRENT),
+            # sonst würden unterschiedlich formatierte Werte dieselbe Beobachtung überschreiben
+            prefix = f"{source_name.upper()}_" if len(source_names) > 1 else ""
+            source, process = SOURCES[source_name](model, store, prefix)
+            sources.append(source)
+            if process is not None:
+                processes.append(process)
+
+        for source in sources:
+            try:
+                source.start()
+            except Exception as e:
+                print(f"Failed to start {source.name} source: {e}")
+                return
+
+        title = " + ".join(source.name for source in sources)
+        # Der MQTT Adapter hatte kein Konsolen-Dashboard; das Leeren der Konsole
+        # würde dort die Verbindungsmeldungen von on_connect löschen
+        console = source_names != ["mqtt"]
+        monitor = PerformanceMonitor(model, store, title, sources, console=console)
+        app = create_app(model, store, monitor, title)
+
+        print("\nStarting performance monitoring...")
+        monitor.start()
+        if console:
+            print("Performance monitoring activated. Console will update every 3 seconds.")
+        else:
+            print(f"Performance monitoring activated. Metrics at http://localhost:{port}/metrics")
+
+        print("\nMTConnect adapter is running!")
+        print("You can access the following endpoints:")
+        print(f"  - http://localhost:{port}/probe")
+        print(f"  - http://localhost:{port}/current")
+        print(f'  - http://localhost:{port}/current?path=//DataItem[@type="AMPERAGE"]')
+        print(f"  - http://localhost:{port}/sample")
+        print(f"  - http://localhost:{port}/metrics")
+
+        app.run(host='0.0.0.0', port=port)
+
+    except KeyboardInterrupt:
+        print("\nShutting down...")
+    finally:
+        # Cleanup
+        for source in sources:
+            try:
+                source.stop()
+            except Exception:
+                pass
+        for process in processes:
+            process.terminate()
+
+def main():
+    choice = input("Sources (mqtt, opcua, both) (default=both): ").strip().lower() or "both"
+    source_names = list(SOURCES) if choice == "both" else [name.strip() for name in choice.split(",")]
+    unknown = [name for name in source_names if name not in SOURCES]
+    if unknown:
+        print(f"Unknown source(s): {', '.join(unknown)}")
+        return
+    run(source_names)
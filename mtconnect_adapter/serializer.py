@@ -0,0 +1,102 @@
+import html
+import threading
+
+from .store import mtconnect_timestamp
+
+def render_data_item(item):
+    attributes = f'category="{item["category"]}" id="{item["id"]}" name="{html.escape(item["name"])}" type="{item["type"]}"'
+    if item["sub_type"]:
+        attributes += f' subType="{item["sub_type"]}"'
+    if item["units"]:
+        attributes += f' units="{item["units"]}" nativeUnits="{item["units"]}"'
+    return f'<DataItem {attributes} />'
+
+def render_component(component, indent):
+    xml = ""
+    if component["tag"] == "Device":
+        xml += f'{indent}<Device uuid="{component["id"]}" name="{html.escape(component["name"])}" id="{component["id"]}">\n'
+        xml += f'{indent}  <Description model="WELDING" manufacturer="WELDING" serialNumber="001">Welding MTConnect Adapter</Description>\n'
+    else:
+        xml += f'{indent}<{component["tag"]} id="{component["id"]}" name="{html.escape(component["name"])}">\n'
+    if component["data_items"]:
+        xml += f'{indent}  <DataItems>\n'
+        for item in component["data_items"]:
+            xml += f'{indent}    {render_data_item(item)}\n'
+        xml += f'{indent}  </DataItems>\n'
+    if component["components"]:
+        xml += f'{indent}  <Components>\n'
+        for sub_component in component["components"]:
+            xml += render_component(sub_component, indent + "    ")
+        xml += f'{indent}  </Components>\n'
+    xml += f'{indent}</{component["tag"]}>\n'
+    return xml
+
+class Serializer:
+    """Renders MTConnectDevices and MTConnectStreams documents for a device model"""
+
+    def __init__(self, model, store):
+        self.model = model
+        self.store = store
+        self.lock = threading.Lock()
+        self.devices_version = None
+        self.devices_xml = ""
+
+    def device_xml(self):
+        """Devices element, rendered once per model version"""
+        with self.lock:
+            if self.devices_version != self.model.version:
+                with self.model.lock:
+                    self.devices_version = self.model.version
+                    self.devices_xml = render_component(self.model.device, "    ")
+            return self.devices_xml
+
+    def probe(self):
+        return f'''<?xml version="1.0" encoding="utf-8"?>
+<MTConnectDevices xmlns:mt="urn:mtconnect.org:MTConnectDevices:1.3" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xmlns="urn:mtconnect.org:MTConnectDevices:1.3" xsi:schemaLocation="urn:mtconnect.org:MTConnectDevices:1.3 ./schemas/Spec1_3/MTConnectDevices_1.3.xsd">
+  <Header creationTime="{mtconnect_timestamp()}" assetBufferSize="1024" sender="WeldingAdapter" assetCount="0" version="1.3" instanceId="1" bufferSize="131072" />
+  <Devices>
+{self.device_xml()}  </Devices>
+</MTConnectDevices>'''
+
+    def streams(self, item_ids=None):
+        """Streams document with the latest observations of item_ids (default: all)"""
+        if item_ids is None:
+            item_ids = self.model.ordered_ids()
+        observations, next_sequence = self.store.select(item_ids)
+
+        # Beobachtungen nach Component gruppieren
+        entries = {}
+        for item_id, (value, timestamp, sequence) in observations:
+            item = self.model.data_items.get(item_id)
+            if item is None:
+                continue
+            component = self.model.item_components[item_id]
+            if component["id"] not in entries:
+                entries[component["id"]] = (component, [], [])
+            entry = f'<{item["type"]} dataItemId="{item_id}" timestamp="{timestamp}" name="{html.escape(item["name"])}" sequence="{sequence}">{html.escape(value)}</{item["type"]}>'
+            if item["category"] == "SAMPLE":
+                entries[component["id"]][1].append(entry)
+            else:
+                entries[component["id"]][2].append(entry)
+
+        streams = ""
+        for component, samples, events in entries.values():
+            streams += f'      <ComponentStream component="{component["tag"]}" name="{html.escape(component["name"])}" componentId="{component["id"]}">\n'
+            if samples:
+                streams += "        <Samples>\n"
+                streams += "".join(f"          {entry}\n" for entry in samples)
+                streams += "        </Samples>\n"
+            if events:
+                streams += "        <Events>\n"
+                streams += "".join(f"          {entry}\n" for entry in events)
+                streams += "        </Events>\n"
+            streams += "      </ComponentStream>\n"
+
+        return f'''<?xml version="1.0" encoding="UTF-8"?>
+<MTConnectStreams xmlns="urn:mtconnect.org:MTConnectStreams:1.3" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">
+  <Header creationTime="{mtconnect_timestamp()}" sender="WeldingAdapter" instanceId="1" bufferSize="130000" version="1.3" nextSequence="{next_sequence}" firstSequence="1" lastSequence="{next_sequence - 1}" />
+  <Streams>
+    <DeviceStream name="{html.escape(self.model.name)}" uuid="{self.model.uuid}">
+{streams}    </DeviceStream>
+  </Streams>
+</MTConnectStreams>'''
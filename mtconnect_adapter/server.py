@@ -0,0 +1,125 @@
+import datetime
+import threading
+
+from flask import Flask, Response, request
+
+from .path_filter import PathFilter, error_xml
+from .serializer import Serializer
+
+def create_app(model, store, monitor=None, title="MTConnect"):
+    """Flask app serving /probe, /current, /sample and (with a monitor) /metrics"""
+    app = Flask(__name__)
+    serializer = Serializer(model, store)
+    filter_lock = threading.Lock()
+    filter_state = {"version": None, "path_filter": None}
+
+    def path_filter():
+        # path= Filter wird pro Version des Geräte-Modells einmalig aufgebaut
+        with filter_lock:
+            version = model.version
+            if filter_state["version"] != version:
+                filter_state["path_filter"] = PathFilter(model.ordered_ids(), serializer.probe())
+                filter_state["version"] = version
+            return filter_state["path_filter"]
+
+    @app.route("/probe")
+    def probe():
+        return Response(serializer.probe(), mimetype='application/xml')
+
+    @app.route("/current")
+    def current():
+        path = request.args.get("path")
+        item_ids = None
+        if path:
+            try:
+                item_ids = path_filter().select(path)
+            except ValueError as e:
+                return Response(error_xml("INVALID_XPATH", str(e)), status=400, mimetype='application/xml')
+        return Response(serializer.streams(item_ids), mimetype='application/xml')
+
+    @app.route("/sample")
+    def sample():
+        return current()
+
+    @app.route("/metrics")
+    def metrics():
+        """Endpoint to display performance metrics"""
+        if monitor is None:
+            return Response("Performance monitoring is disabled", status=404)
+        performance_metrics = monitor.metrics
+        # Eine Abfragerate pro Quelle, Polls und Nachrichten sind nicht vergleichbar
+        update_rates = ""
+        for name, update_rate in performance_metrics["update_rates"].items():
+            heading = f"Abfragerate ({name})" if len(performance_metrics["update_rates"]) > 1 else "Abfragerate"
+            update_rates += f"""
+            <div class="metric">
+                <h3>{heading}</h3>
+                <div class="value">{update_rate:.2f} Updates/Sekunde</div>
+                <div class="label">Durchschnittliche Anzahl der Abfragen (OPC UA) bzw. Nachrichten (MQTT) pro Sekunde</div>
+            </div>
+"""
+        html_content = f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>{title}-MTConnect Adapter Metriken</title>
+        <style>
+            body {{ font-family: Arial, sans-serif; margin: 20px; }}
+            .metric {{ margin-bottom: 20px; border: 1px solid #ddd; padding: 15px; border-radius: 5px; }}
+            .metric h3 {{ margin-top: 0; color: #333; }}
+            .value {{ font-size: 24px; font-weight: bold; color: #0066cc; }}
+            .label {{ color: #666; }}
+            .update-time {{ font-size: 12px; color: #999; margin-top: 10px; }}
+            .container {{ max-width: 800px; margin: 0 auto; }}
+            .header {{ background-color: #f5f5f5; padding: 10px; margin-bottom: 20px; border-radius: 5px; }}
+        </style>
+        <meta http-equiv="refresh" content="2">
+    </head>
+    <body>
+        <div class="container">
+            <div class="header">
+                <h1>{title}-MTConnect Adapter Leistungsmetriken</h1>
+                <p>Echtzeit-Überwachung der Adapter-Leistung</p>
+            </div>
+
+            <div class="metric">
+                <h3>Verzögerung ({title} → HTTP)</h3>
+                <div class="value">{performance_metrics["delay_ms"]:.2f} ms</div>
+                <div class="label">Durchschnittliche Verzögerung zwischen Datenempfang und HTTP-Verfügbarkeit</div>
+            </div>
+
+{update_rates}
+
+            <div class="metric">
+                <h3>Empfangene Werte</h3>
+                <div class="value">{performance_metrics["value_rate"]:.2f} Werte/Sekunde</div>
+                <div class="label">Durchschnittliche Anzahl empfangener Variablenwerte pro Sekunde</div>
+            </div>
+
+            <div class="metric">
+                <h3>Speicherverbrauch</h3>
+                <div class="value">{performance_metrics["memory_mb"]:.2f} MB</div>
+                <div class="label">Aktueller Arbeitsspeicherverbrauch des Prozesses</div>
+            </div>
+
+            <div class="metric">
+                <h3>CPU-Auslastung</h3>
+                <div class="value">{performance_metrics["cpu_percent"]:.2f}%</div>
+                <div class="label">Aktuelle CPU-Auslastung des Prozesses</div>
+            </div>
+
+            <div class="update-time">
+                Letzte Aktualisierung: {datetime.datetime.fromtimestamp(performance_metrics["last_updated"]).strftime('%H:%M:%S')}
+            </div>
+
+            <div class="header">
+                <p>Insgesamt empfangene Updates: {store.update_count}</p>
+                <p>Überwachte Variablen: {len(store.received)}</p>
+            </div>
+        </div>
+    </body>
+    </html>
+    """
+        return html_content
+
+    return app
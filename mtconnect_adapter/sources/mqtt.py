@@ -0,0 +1,81 @@
+import os
+import subprocess
+import sys
+import time
+
+from paho.mqtt import client as mqtt_client
+
+from ..registry import MONITORED_VARIABLES, welding_component
+
+def start_mosquitto():
+    if getattr(sys, 'frozen', False):
+        # Running as a exe
+        exe_dir = os.path.dirname(sys.executable)
+    else:
+        # Running as a script
+        exe_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    mosquitto_path = os.path.join(exe_dir, "mosquitto", "mosquitto.exe")
+    print("EXE-Ordner:", exe_dir)
+    print("Gesuchter Mosquitto Pfad:", mosquitto_path)
+
+    try:
+        # Start mosquitto broker
+        broker_process = subprocess.Popen([mosquitto_path, "-v"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE)
+        print("Mosquitto erfolgreich gestartet")
+        return broker_process
+    except Exception as e:
+        print(f"Mosquitto broker konnte nicht gestartet werden: {e}")
+        sys.exit(1)
+
+class MqttSource:
+    """Subscribes to the welding machine topics and writes values to the store.
+
+    prefix is put in front of every data item id so several sources can
+    publish the same variable list without sharing observations.
+    """
+
+    name = "MQTT"
+
+    def __init__(self, model, store, host, port=1883, topic="FRONIUS/welding/data/#", variables=MONITORED_VARIABLES, prefix=""):
+        self.store = store
+        self.prefix = prefix
+        self.host = host
+        self.port = int(port)
+        self.topic = topic
+        self.variables = set(variables)
+
+        component = welding_component(model)
+        for key in variables:
+            model.add_variable(component, prefix + key)
+
+        self.client = mqtt_client.Client(f'python-mqtt-{time.time()}')
+        self.client.on_connect = self.on_connect
+        self.client.on_message = self.on_message
+
+    def on_connect(self, client, userdata, flags, rc):
+        if rc == 0:
+            print("Connected to MQTT Broker!")
+            # Nach Reconnect erneut abonnieren
+            client.subscribe(self.topic)
+            print(f"Subscribed to: {self.topic}")
+        else:
+            print(f"Failed to connect, return code {rc}")
+
+    def on_message(self, client, userdata, msg):
+        # Extrahiere den Variablennamen aus dem Topic
+        variable = msg.topic.split("/")[-1]
+        if variable in self.variables:
+            self.store.update(self.prefix + variable, msg.payload.decode())
+            self.store.complete_cycle(self.prefix)
+
+    def start(self):
+        print(f"Connecting to MQTT broker at {self.host}:{self.port}")
+        self.client.connect(self.host, self.port)
+        self.client.loop_start()
+
+    def stop(self):
+        self.client.loop_stop()
+        self.client.disconnect()
@@ -0,0 +1,195 @@
+import threading
+import time
+
+from opcua import Client, ua
+
+from ..registry import MONITORED_VARIABLES, classify_variable, welding_component
+
+# OPC UA EngineeringUnits (EUInformation.DisplayName) -> MTConnect Typ und Einheit
+ENGINEERING_UNITS = {
+    "A": ("AMPERAGE", "AMPERE"),
+    "V": ("VOLTAGE", "VOLT"),
+    "W": ("POWER", "WATT"),
+    "°C": ("TEMPERATURE", "CELSIUS"),
+    "s": ("ACCUMULATED_TIME", "SECOND"),
+    "l/min": ("FLOW", "LITER/MINUTE"),
+    "mm/s": ("VELOCITY", "MILLIMETER/SECOND"),
+}
+
+# Numerische OPC UA Datentypen werden als SAMPLE abgebildet, alles andere als EVENT
+NUMERIC_TYPES = {
+    "SByte", "Byte", "Int16", "UInt16", "Int32", "UInt32",
+    "Int64", "UInt64", "Float", "Double"
+}
+
+# <Component> ist im MTConnectDevices 1.3 Schema abstrakt. Ordner mit bekanntem
+# Namen werden auf das passende Element abgebildet, alle anderen auf Systems
+COMPONENT_TYPES = {
+    "actuator": "Actuator", "axes": "Axes", "controller": "Controller", "door": "Door",
+    "electric": "Electric", "pneumatic": "Pneumatic", "sensor": "Sensor", "systems": "Systems",
+}
+DEFAULT_COMPONENT_TYPE = "Systems"
+
+# Typen der Namens-Heuristik, die nur für SAMPLE Datenpunkte gültig sind
+SAMPLE_TYPES = {
+    "AMPERAGE", "VOLTAGE", "TEMPERATURE", "POWER", "ACCUMULATED_TIME", "FLOW", "VELOCITY"
+}
+
+def describe_variable(node, name):
+    """MTConnect category, type and units from the node's data type and EngineeringUnits"""
+    category, dtype, units = classify_variable(name)
+    try:
+        variant_type = node.get_data_type_as_variant_type().name
+    except:
+        # Datentyp nicht lesbar: nur die Namens-Heuristik verwenden
+        return category, dtype, units
+
+    if variant_type not in NUMERIC_TYPES:
+        # Boolean, String, ... sind EVENTs; Messgrößen-Typen passen dazu nicht
+        if dtype in SAMPLE_TYPES or dtype == "VALUE":
+            dtype = "MESSAGE"
+        return "EVENT", dtype, None
+
+    # Numerische Knoten ohne passenden Namen bekommen einen generischen Typ
+    if dtype not in SAMPLE_TYPES:
+        dtype, units = "VALUE", None
+    try:
+        eu_info = node.get_child("0:EngineeringUnits").get_value()
+        if eu_info.DisplayName.Text in ENGINEERING_UNITS:
+            dtype, units = ENGINEERING_UNITS[eu_info.DisplayName.Text]
+    except:
+        pass
+    return "SAMPLE", dtype, units
+
+class OpcUaSource:
+    """Polls OPC UA variables and writes their values to the store.
+
+    By default the fixed variable list is searched and published flat under
+    the Welding component, with prefix in front of every data item id. With
+    map_address_space the folder structure below Objects is mapped to
+    MTConnect components instead.
+    """
+
+    name = "OPC UA"
+
+    def __init__(self, model, store, endpoint, map_address_space=False, variables=MONITORED_VARIABLES, interval=1, prefix=""):
+        self.model = model
+        self.prefix = prefix
+        self.store = store
+        self.endpoint = endpoint
+        self.map_address_space = map_address_space
+        self.variables = set(variables)
+        self.interval = interval
+        self.client = Client(endpoint)
+        self.found_nodes = {}
+
+    def browse_and_find_variables(self):
+        found = {}
+        component = welding_component(self.model)
+        objects_node = self.client.get_objects_node()
+        stack = [objects_node]
+        # Mehrfach referenzierte Knoten und Zyklen nur einmal besuchen
+        seen = {objects_node.nodeid}
+
+        while stack:
+            node = stack.pop()
+            try:
+                for child in node.get_children():
+                    try:
+                        if child.nodeid in seen:
+                            continue
+                        seen.add(child.nodeid)
+                        name = child.get_browse_name().Name
+                        if name in self.variables:
+                            self.model.add_variable(component, self.prefix + name)
+                            found[self.prefix + name] = child
+                        stack.append(child)
+                    except:
+                        continue
+            except:
+                continue
+        return found
+
+    def browse_address_space(self):
+        """Map the OPC UA folder structure below Objects to MTConnect components"""
+        found = {}
+        folders = {"name": "Objects", "path": [], "data_items": [], "components": []}
+        objects_node = self.client.get_objects_node()
+        stack = [(objects_node, folders, [])]
+        # Jeder Knoten wird nur einmal abgebildet, auch wenn er von mehreren
+        # Ordnern referenziert wird oder eine Referenz auf einen Vorfahren zeigt
+        seen = {objects_node.nodeid}
+
+        while stack:
+            node, folder, path = stack.pop()
+            try:
+                children = node.get_children()
+            except:
+                continue
+            for child in children:
+                try:
+                    # Server-Objekt und Standardknoten (Namespace 0) überspringen
+                    if child.nodeid.NamespaceIndex == 0 or child.nodeid in seen:
+                        continue
+                    seen.add(child.nodeid)
+                    name = child.get_browse_name().Name
+                    child_path = path + [name]
+                    node_class = child.get_node_class()
+                    if node_class == ua.NodeClass.Variable:
+                        folder["data_items"].append((child_path, name, child))
+                    # Nur Objekte/Views sind Ordner; Methoden samt Input-/OutputArguments
+                    # werden weder Components noch abgefragte DataItems
+                    elif node_class in (ua.NodeClass.Object, ua.NodeClass.View):
+                        sub_folder = {"name": name, "path": child_path, "data_items": [], "components": []}
+                        folder["components"].append(sub_folder)
+                        stack.append((child, sub_folder, child_path))
+                except:
+                    continue
+
+        # Variablen direkt unter Objects bekommen eine eigene Component
+        if folders["data_items"]:
+            folders["components"].insert(0, {"name": "Objects", "path": [], "data_items": folders["data_items"], "components": []})
+        for sub_folder in folders["components"]:
+            self.register_folder(sub_folder, None, found)
+        return found
+
+    def register_folder(self, folder, parent, found):
+        """Register a browsed folder as component, folders without variables are skipped"""
+        if not self.has_variables(folder):
+            return
+        component_id = self.model.unique_id(folder["path"] or ["Objects"])
+        tag = COMPONENT_TYPES.get(folder["name"].lower(), DEFAULT_COMPONENT_TYPE)
+        component = self.model.add_component(component_id, folder["name"], parent, tag)
+        for path, name, node in folder["data_items"]:
+            category, dtype, units = describe_variable(node, name)
+            item_id = self.model.unique_id(path)
+            self.model.add_data_item(component, item_id, name, category, dtype, units)
+            found[item_id] = node
+        for sub_folder in folder["components"]:
+            self.register_folder(sub_folder, component, found)
+
+    def has_variables(self, folder):
+        return bool(folder["data_items"]) or any(self.has_variables(sub_folder) for sub_folder in folder["components"])
+
+    def update_values(self):
+        while True:
+            for key, node in self.found_nodes.items():
+                try:
+                    self.store.update(key, node.get_value())
+                except:
+                    continue
+            self.store.complete_cycle(self.prefix)
+            time.sleep(self.interval)
+
+    def start(self):
+        print(f"Connecting to: {self.endpoint}")
+        self.client.connect()
+        if self.map_address_space:
+            self.found_nodes = self.browse_address_space()
+            print(f"Mapped {len(self.found_nodes)} OPC UA variables")
+        else:
+            self.found_nodes = self.browse_and_find_variables()
+        threading.Thread(target=self.update_values, daemon=True).start()
+
+    def stop(self):
+        self.client.disconnect()
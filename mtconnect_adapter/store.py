@@ -0,0 +1,73 @@
+import threading
+import time
+from collections import deque
+
+def mtconnect_timestamp(seconds=None):
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(seconds))
+
+class ObservationStore:
+    """Latest observation per data item, shared by all sources.
+
+    Every changed value gets the next MTConnect sequence number; repeated
+    identical values (e.g. from OPC UA polling) only refresh the receive
+    time used for the delay metric.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.observations = {}  # data item id -> (value, timestamp, sequence)
+        self.received = {}  # data item id -> time of the last update
+        self.receive_times = deque(maxlen=100)  # Store last 100 update times for rate calculation
+        self.cycle_times = {}  # source prefix -> last 100 update cycles (OPC UA polls, MQTT messages)
+        self.update_count = 0
+        self.sequence = 1
+
+    def update(self, item_id, value, internal=False):
+        """Record a value; internal updates (adapter metrics) are not counted as received"""
+        now = time.time()
+        value = str(value)
+        with self.lock:
+            if not internal:
+                self.received[item_id] = now
+                self.receive_times.append(now)
+                self.update_count += 1
+            previous = self.observations.get(item_id)
+            if previous is not None and previous[0] == value:
+                return
+            self.observations[item_id] = (value, mtconnect_timestamp(now), self.sequence)
+            self.sequence += 1
+
+    def select(self, item_ids):
+        """Observations for item_ids (in that order) and the next sequence number"""
+        with self.lock:
+            observations = [(item_id, self.observations[item_id]) for item_id in item_ids if item_id in self.observations]
+            return observations, self.sequence
+
+    def average_delay_ms(self):
+        """Average age of the latest update per data item"""
+        now = time.time()
+        with self.lock:
+            if not self.received:
+                return 0
+            return sum(now - received for received in self.received.values()) * 1000 / len(self.received)
+
+    def complete_cycle(self, source=""):
+        """Mark the end of one update cycle (an OPC UA poll or an MQTT message) of source"""
+        with self.lock:
+            self.cycle_times.setdefault(source, deque(maxlen=100)).append(time.time())
+
+    def update_rate(self, source=""):
+        """Update cycles per second of source over its last 100 cycles"""
+        with self.lock:
+            return rate(self.cycle_times.get(source, ()))
+
+    def value_rate(self):
+        """Received values per second over the last 100 updates"""
+        with self.lock:
+            return rate(self.receive_times)
+
+def rate(times):
+    if len(times) < 2:
+        return 0
+    duration = times[-1] - times[0]
+    return (len(times) - 1) / duration if duration > 0 else 0
@@ -0,0 +1,81 @@
+import unittest
+
+from mtconnect_adapter.path_filter import PathFilter
+
+PROBE_XML = '''<?xml version="1.0" encoding="utf-8"?>
+<MTConnectDevices xmlns="urn:mtconnect.org:MTConnectDevices:1.3">
+  <Devices>
+    <Device uuid="WELDING.001" name="WELDING" id="WELDING.001">
+      <DataItems>
+        <DataItem category="EVENT" id="Wavail" name="avail" type="AVAILABILITY" />
+      </DataItems>
+      <Components>
+        <Welding id="WeldingSystem" name="WeldingSystem">
+          <DataItems>
+            <DataItem category="SAMPLE" id="ACTUAL_CURRENT" name="ACTUAL_CURRENT" type="AMPERAGE" />
+            <DataItem category="SAMPLE" id="ACTUAL_VOLTAGE" name="ACTUAL_VOLTAGE" type="VOLTAGE" />
+            <DataItem category="SAMPLE" id="JOBNAME" name="job or name" type="A|B" />
+          </DataItems>
+        </Welding>
+        <Systems id="WSystems1" name="Systems1">
+          <Components>
+            <Electric id="WElectricSystem1" name="ElectricSystem1">
+              <DataItems>
+                <DataItem category="CONDITION" id="WElectricSystem1_cond" name="ElectricSystem1_cond" type="SYSTEM" />
+              </DataItems>
+            </Electric>
+          </Components>
+        </Systems>
+      </Components>
+    </Device>
+  </Devices>
+</MTConnectDevices>'''
+
+DATA_ITEM_IDS = ["Wavail", "ACTUAL_CURRENT", "ACTUAL_VOLTAGE", "JOBNAME", "WElectricSystem1_cond"]
+
+class PathFilterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.path_filter = PathFilter(DATA_ITEM_IDS, PROBE_XML)
+
+    def test_union(self):
+        self.assertEqual(
+            self.path_filter.select('//DataItem[@type="VOLTAGE"]|//DataItem[@type="AVAILABILITY"]'),
+            ["Wavail", "ACTUAL_VOLTAGE"])
+
+    def test_or_predicate(self):
+        self.assertEqual(
+            self.path_filter.select('//DataItem[@type="AMPERAGE" or @type="VOLTAGE"]'),
+            ["ACTUAL_CURRENT", "ACTUAL_VOLTAGE"])
+
+    def test_quoted_separators(self):
+        self.assertEqual(self.path_filter.select('//DataItem[@type="A|B"]'), ["JOBNAME"])
+        self.assertEqual(self.path_filter.select("//DataItem[@name='job or name']"), ["JOBNAME"])
+
+    def test_absolute_path(self):
+        self.assertEqual(
+            self.path_filter.select("/MTConnectDevices/Devices/Device/DataItems/DataItem"),
+            ["Wavail"])
+
+    def test_component_selects_descendants(self):
+        self.assertEqual(
+            self.path_filter.select("//Welding"),
+            ["ACTUAL_CURRENT", "ACTUAL_VOLTAGE", "JOBNAME"])
+        self.assertEqual(self.path_filter.select("//Systems"), ["WElectricSystem1_cond"])
+
+    def test_lru_eviction(self):
+        path_filter = PathFilter(DATA_ITEM_IDS, PROBE_XML, max_size=2)
+        path_filter.compile("//Welding")
+        path_filter.compile("//Systems")
+        # Zugriff macht //Welding zum zuletzt verwendeten Eintrag
+        path_filter.compile("//Welding")
+        path_filter.compile("//Device")
+        self.assertEqual(list(path_filter.cache), ["//Welding", "//Device"])
+
+    def test_invalid_path(self):
+        for path in ["//DataItem[@", "//Welding|", ""]:
+            with self.assertRaises(ValueError):
+                self.path_filter.select(path)
+
+if __name__ == "__main__":
+    unittest.main()